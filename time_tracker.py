@@ -8,6 +8,8 @@ import threading
 import time
 import shutil
 import csv
+import re
+from bisect import bisect_left, bisect_right, insort
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
@@ -18,7 +20,164 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from pynput import keyboard
 
+class EntryIndex:
+    """Inverted, start-time and rate indexes over the time entry history.
+
+    The index references the app's ``time_entries`` list rather than copying
+    it; entry ids are positions in that list, so entries must only ever be
+    appended and then registered with ``add``.
+    """
+    TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.tokens = {'project': {}, 'category': {}}
+        self.name_tokens = {}
+
+        # Bulk build: group ids by name so each distinct name is tokenized once
+        for field, postings in self.tokens.items():
+            ids_by_name = {}
+            for entry_id, entry in enumerate(entries):
+                ids_by_name.setdefault(entry.get(field), []).append(entry_id)
+            for name, ids in ids_by_name.items():
+                for token in self._name_tokens(name):
+                    postings.setdefault(token, set()).update(ids)
+        # Sorted token lists let a query token find every token it prefixes
+        self.sorted_tokens = {field: sorted(postings) for field, postings in self.tokens.items()}
+
+        billable = {i for i, entry in enumerate(entries) if entry.get('billable', True)}
+        self.billable_ids = {True: billable, False: set(range(len(entries))) - billable}
+        self.entry_starts = [datetime.fromisoformat(entry['start']) for entry in entries]
+        self.entry_rates = [float(entry.get('rate', 0)) for entry in entries]
+
+        # Sort once up front; only incremental adds pay for an insort
+        self.start_ids = sorted(range(len(entries)), key=self.entry_starts.__getitem__)
+        self.start_keys = [self.entry_starts[i] for i in self.start_ids]
+        self.rate_ids = sorted(range(len(entries)), key=self.entry_rates.__getitem__)
+        self.rate_keys = [self.entry_rates[i] for i in self.rate_ids]
+
+    @classmethod
+    def tokenize(cls, text):
+        """Split a project or category name into casefolded search tokens"""
+        return set(cls.TOKEN_PATTERN.findall((text or '').casefold()))
+
+    def _name_tokens(self, name):
+        """Tokenize a name, caching the result since names repeat across entries"""
+        tokens = self.name_tokens.get(name)
+        if tokens is None:
+            tokens = self.name_tokens[name] = self.tokenize(name)
+        return tokens
+
+    def add(self, entry_id):
+        """Index the entry that was just appended to the entries list"""
+        entry = self.entries[entry_id]
+        for field, postings in self.tokens.items():
+            for token in self._name_tokens(entry.get(field)):
+                if token not in postings:
+                    insort(self.sorted_tokens[field], token)
+                postings.setdefault(token, set()).add(entry_id)
+        self.billable_ids[bool(entry.get('billable', True))].add(entry_id)
+        self.entry_starts.append(datetime.fromisoformat(entry['start']))
+        self.entry_rates.append(float(entry.get('rate', 0)))
+
+        # Entries are normally saved in start order, so this is usually an append
+        for keys, ids, key in ((self.start_keys, self.start_ids, self.entry_starts[entry_id]),
+                               (self.rate_keys, self.rate_ids, self.entry_rates[entry_id])):
+            pos = bisect_right(keys, key)
+            keys.insert(pos, key)
+            ids.insert(pos, entry_id)
+
+    def _prefix_ids(self, field, prefix):
+        """Return ids of entries with a token in field that starts with prefix"""
+        tokens = self.sorted_tokens[field]
+        postings = self.tokens[field]
+        pos = bisect_left(tokens, prefix)
+        matches = []
+        while pos < len(tokens) and tokens[pos].startswith(prefix):
+            matches.append(postings[tokens[pos]])
+            pos += 1
+        if len(matches) == 1:
+            return matches[0]
+        return set().union(*matches)
+
+    def search(self, project='', category='', start_date=None, end_date=None,
+               billable=None, min_rate=None, max_rate=None):
+        """Return ids of entries matching every given filter, ordered by start time
+
+        Project and category queries match entries whose names have a token
+        starting with each of the query's tokens, so 'clie' finds 'Client'. ``end_date`` is exclusive, the rate bounds inclusive.
+        The most selective filter drives the lookup, so cost grows with the
+        smallest matching set rather than with the history.
+        """
+        id_sets = []
+        for field, query in (('project', project), ('category', category)):
+            tokens = self.tokenize(query)
+            if not tokens and query and query.strip():
+                # A query with no searchable characters cannot match anything
+                return []
+            id_sets.extend(self._prefix_ids(field, token) for token in tokens)
+        if billable is not None:
+            id_sets.append(self.billable_ids[billable])
+
+        start_lo = 0 if start_date is None else bisect_left(self.start_keys, start_date)
+        start_hi = len(self.start_keys) if end_date is None else bisect_left(self.start_keys, end_date)
+        rate_lo = 0 if min_rate is None else bisect_left(self.rate_keys, min_rate)
+        rate_hi = len(self.rate_keys) if max_rate is None else bisect_right(self.rate_keys, max_rate)
+        if start_hi <= start_lo or rate_hi <= rate_lo:
+            return []
+
+        id_sets.sort(key=len)
+        smallest = min(
+            len(id_sets[0]) if id_sets else float('inf'),
+            start_hi - start_lo,
+            rate_hi - rate_lo
+        )
+
+        if smallest == start_hi - start_lo:
+            driver, ids = 'start', self.start_ids[start_lo:start_hi]
+        elif id_sets and smallest == len(id_sets[0]):
+            driver, ids = 'set', id_sets.pop(0)
+        else:
+            driver, ids = 'rate', self.rate_ids[rate_lo:rate_hi]
+
+        for id_set in id_sets:
+            ids = [i for i in ids if i in id_set]
+        if driver != 'start':
+            if start_date is not None:
+                ids = [i for i in ids if self.entry_starts[i] >= start_date]
+            if end_date is not None:
+                ids = [i for i in ids if self.entry_starts[i] < end_date]
+        if driver != 'rate':
+            if min_rate is not None:
+                ids = [i for i in ids if self.entry_rates[i] >= min_rate]
+            if max_rate is not None:
+                ids = [i for i in ids if self.entry_rates[i] <= max_rate]
+
+        if driver == 'start':
+            return ids
+        return sorted(ids, key=self.entry_starts.__getitem__)
+
+
 class TimeTrackerApp:
+    DISPLAY_ROW_LIMIT = 1000  # rows rendered in search and report tree views
+    MAX_REPORT_BARS = 31  # bars drawn in the report hours chart
+    MAX_PIE_WEDGES = 8  # wedges drawn in the report project chart
+    # Bucket resolutions for report charts, finest first
+    REPORT_RESOLUTIONS = [
+        ('D', "Daily"),
+        ('W-SUN', "Weekly"),
+        ('M', "Monthly"),
+        ('Q', "Quarterly"),
+        ('Y', "Yearly"),
+    ]
+    REPORT_LABEL_FORMATS = {
+        'D': '%b %d',
+        'W-SUN': 'w/e %b %d',  # weeks are labelled by their ending Sunday
+        'M': '%b %Y',
+        'Q': 'Q%q %Y',
+        'Y': '%Y',
+    }
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Enhanced Time Tracker")
@@ -37,6 +196,7 @@ class TimeTrackerApp:
         self.start_time = None
         self.last_activity = time.time()
         self.time_entries = self.load_data()
+        self.entry_index = EntryIndex(self.time_entries)
         
         # Settings
         self.idle_threshold = 300  # 5 minutes default
@@ -197,7 +357,7 @@ class TimeTrackerApp:
         self.reports_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
         # Add report buttons
-        for report_type in ["Daily", "Weekly", "Monthly"]:
+        for report_type in ["Daily", "Weekly", "Monthly", "Quarterly", "Yearly"]:
             btn = ttk.Button(
                 self.reports_frame,
                 text=f"{report_type} Report",
@@ -205,6 +365,19 @@ class TimeTrackerApp:
             )
             btn.pack(fill=tk.X, pady=2, padx=5)
         
+        ttk.Button(
+            self.reports_frame,
+            text="Custom Range Report",
+            command=self.custom_report_dialog
+        ).pack(fill=tk.X, pady=2, padx=5)
+        
+        # Add search button
+        ttk.Button(
+            self.reports_frame,
+            text="Search Entries",
+            command=self.show_search_window
+        ).pack(fill=tk.X, pady=2, padx=5)
+        
         # Add time summary button
         ttk.Button(
             self.reports_frame,
@@ -338,6 +511,7 @@ class TimeTrackerApp:
             }
             
             self.time_entries.append(entry)
+            self.entry_index.add(len(self.time_entries) - 1)
             self.save_data()
             
             self.start_time = None
@@ -458,6 +632,135 @@ class TimeTrackerApp:
             command=lambda: self.export_summary(totals)
         ).pack(pady=5)
 
+    def show_search_window(self):
+        """Display window for searching and filtering the full entry history"""
+        search_window = tk.Toplevel(self.root)
+        search_window.title("Search Entries")
+        search_window.geometry("800x600")
+        
+        # Query fields
+        query_frame = ttk.LabelFrame(search_window, text="Filters", padding="5")
+        query_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        project_var = tk.StringVar()
+        category_var = tk.StringVar()
+        from_var = tk.StringVar()
+        to_var = tk.StringVar()
+        billable_var = tk.StringVar(value="Any")
+        min_rate_var = tk.StringVar()
+        max_rate_var = tk.StringVar()
+        
+        fields = [
+            ("Project:", project_var, 0, 0),
+            ("Category:", category_var, 0, 2),
+            ("From (YYYY-MM-DD):", from_var, 1, 0),
+            ("To (YYYY-MM-DD):", to_var, 1, 2),
+            ("Min rate ($/hr):", min_rate_var, 2, 0),
+            ("Max rate ($/hr):", max_rate_var, 2, 2),
+        ]
+        for label, var, row, column in fields:
+            ttk.Label(query_frame, text=label).grid(row=row, column=column, padx=5, sticky='w')
+            ttk.Entry(query_frame, textvariable=var, width=15).grid(
+                row=row, column=column + 1, padx=5, pady=2, sticky='ew'
+            )
+        
+        ttk.Label(query_frame, text="Billable:").grid(row=3, column=0, padx=5, sticky='w')
+        ttk.Combobox(
+            query_frame,
+            textvariable=billable_var,
+            values=["Any", "Yes", "No"],
+            state="readonly",
+            width=13
+        ).grid(row=3, column=1, padx=5, pady=2, sticky='ew')
+        
+        status_label = ttk.Label(search_window, text="")
+        status_label.pack(fill=tk.X, padx=5)
+        
+        # Results treeview
+        results_frame = ttk.Frame(search_window)
+        results_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tree = ttk.Treeview(results_frame)
+        tree["columns"] = ("project", "category", "start", "duration", "billable", "rate")
+        
+        tree.column("#0", width=0, stretch=tk.NO)
+        tree.column("project", anchor=tk.W, width=120)
+        tree.column("category", anchor=tk.W, width=120)
+        tree.column("start", anchor=tk.W, width=140)
+        tree.column("duration", anchor=tk.E, width=80)
+        tree.column("billable", anchor=tk.CENTER, width=70)
+        tree.column("rate", anchor=tk.E, width=80)
+        
+        tree.heading("project", text="Project", anchor=tk.W)
+        tree.heading("category", text="Category", anchor=tk.W)
+        tree.heading("start", text="Start Time", anchor=tk.W)
+        tree.heading("duration", text="Hours", anchor=tk.E)
+        tree.heading("billable", text="Billable")
+        tree.heading("rate", text="Rate", anchor=tk.E)
+        
+        scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=tree.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        results = []
+        
+        def run_search():
+            try:
+                start_date = datetime.strptime(from_var.get(), '%Y-%m-%d') if from_var.get() else None
+                end_date = datetime.strptime(to_var.get(), '%Y-%m-%d') + timedelta(days=1) if to_var.get() else None
+                min_rate = float(min_rate_var.get()) if min_rate_var.get() else None
+                max_rate = float(max_rate_var.get()) if max_rate_var.get() else None
+            except (ValueError, OverflowError):
+                self.show_message("Please enter dates as YYYY-MM-DD and rates as numbers!")
+                return
+            
+            billable = {"Yes": True, "No": False}.get(billable_var.get())
+            results[:] = self.entry_index.search(
+                project=project_var.get(),
+                category=category_var.get(),
+                start_date=start_date,
+                end_date=end_date,
+                billable=billable,
+                min_rate=min_rate,
+                max_rate=max_rate
+            )
+            
+            # Only render the most recent matches; export covers the full result set
+            tree.delete(*tree.get_children())
+            for entry_id in reversed(results[-self.DISPLAY_ROW_LIMIT:]):
+                entry = self.time_entries[entry_id]
+                tree.insert("", "end", values=(
+                    entry['project'],
+                    entry.get('category', ''),
+                    datetime.fromisoformat(entry['start']).strftime('%Y-%m-%d %H:%M'),
+                    f"{entry['duration'] / 3600:.2f}",
+                    "Yes" if entry.get('billable', True) else "No",
+                    f"${entry.get('rate', 0):.2f}"
+                ))
+            
+            total_hours = sum(self.time_entries[i]['duration'] for i in results) / 3600
+            shown = min(len(results), self.DISPLAY_ROW_LIMIT)
+            status_label.config(
+                text=f"{len(results)} entries, {total_hours:.2f} hours (showing {shown} most recent)"
+            )
+        
+        def export_results():
+            if not results:
+                self.show_message("No search results to export!")
+                return
+            df = pd.DataFrame([self.time_entries[i] for i in results])
+            df['start'] = pd.to_datetime(df['start'])
+            df['duration'] = df['duration'] / 3600  # Convert to hours
+            self.export_data(df, 'csv')
+        
+        button_frame = ttk.Frame(query_frame)
+        button_frame.grid(row=3, column=2, columnspan=2, pady=2)
+        ttk.Button(button_frame, text="Search", command=run_search).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Export to CSV", command=export_results).pack(side=tk.LEFT, padx=5)
+        
+        search_window.bind('<Return>', lambda e: run_search())
+
     def export_summary(self, totals):
         """Export time summary to CSV"""
         file_path = filedialog.asksaveasfilename(
@@ -490,14 +793,107 @@ class TimeTrackerApp:
         """Show a message box with the given message"""
         messagebox.showinfo("Time Tracker", message)
         
-    def generate_report(self, report_type):
-        """Generate enhanced report with plots"""
-        df = pd.DataFrame(self.time_entries)
-        if df.empty:
+    def get_report_range(self, report_type):
+        """Return the (start, end, title) of a preset report period, end exclusive"""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        if report_type == 'daily':
+            return today, today + timedelta(days=1), "Today"
+        elif report_type == 'weekly':
+            start_date = today - timedelta(days=today.weekday())
+            return start_date, start_date + timedelta(days=7), "This Week"
+        elif report_type == 'monthly':
+            start_date = today.replace(day=1)
+            end_date = (start_date + timedelta(days=32)).replace(day=1)
+            return start_date, end_date, "This Month"
+        elif report_type == 'quarterly':
+            start_date = today.replace(month=(today.month - 1) // 3 * 3 + 1, day=1)
+            end_date = (start_date + timedelta(days=95)).replace(day=1)
+            return start_date, end_date, "This Quarter"
+        else:  # yearly
+            start_date = today.replace(month=1, day=1)
+            return start_date, start_date.replace(year=start_date.year + 1), "This Year"
+
+    def bucket_durations(self, df, start_date, end_date):
+        """Sum hours per bucket, picking the finest resolution that fits the span
+
+        Returns a Series indexed by bucket label covering the whole range
+        (empty buckets included) and the resolution's display name.
+        """
+        last = end_date - timedelta(microseconds=1)
+        for freq, name in self.REPORT_RESOLUTIONS:
+            buckets = pd.period_range(start_date, last, freq=freq)
+            if len(buckets) <= self.MAX_REPORT_BARS:
+                break
+        
+        totals = df.groupby(df['start'].dt.to_period(freq))['duration'].sum()
+        totals = totals.reindex(buckets, fill_value=0)
+        totals.index = buckets.strftime(self.REPORT_LABEL_FORMATS[freq])
+        
+        if len(totals) > self.MAX_REPORT_BARS:
+            # Even yearly bars overflow: merge consecutive years into multi-year bars
+            years = -(-len(totals) // self.MAX_REPORT_BARS)
+            groups = [i // years for i in range(len(totals))]
+            labels = [f"{first}-{last}" if first != last else first for first, last in zip(
+                totals.index[::years], totals.index[years - 1::years].append(totals.index[-1:])
+            )]
+            totals = totals.groupby(groups).sum()
+            totals.index = labels
+            name = f"{years}-Year"
+        return totals, name
+
+    def custom_report_dialog(self):
+        """Open dialog to generate a report for an arbitrary date range"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Custom Report")
+        dialog.geometry("300x160")
+        
+        ttk.Label(dialog, text="From (YYYY-MM-DD):").pack(pady=2)
+        from_entry = ttk.Entry(dialog)
+        from_entry.pack(pady=2)
+        
+        ttk.Label(dialog, text="To (YYYY-MM-DD):").pack(pady=2)
+        to_entry = ttk.Entry(dialog)
+        to_entry.insert(0, datetime.now().strftime('%Y-%m-%d'))
+        to_entry.pack(pady=2)
+        
+        def run_report():
+            try:
+                start_date = datetime.strptime(from_entry.get(), '%Y-%m-%d')
+                end_date = datetime.strptime(to_entry.get(), '%Y-%m-%d') + timedelta(days=1)
+            except (ValueError, OverflowError):
+                self.show_message("Please enter dates as YYYY-MM-DD!")
+                return
+            if end_date <= start_date:
+                self.show_message("The end date must not be before the start date!")
+                return
+            dialog.destroy()
+            self.generate_report('custom', start_date, end_date)
+        
+        ttk.Button(dialog, text="Generate", command=run_report).pack(pady=5)
+
+    def generate_report(self, report_type, start_date=None, end_date=None):
+        """Generate enhanced report with plots
+
+        Preset report types cover the current period; 'custom' reports cover
+        start_date up to (excluding) end_date.
+        """
+        if not self.time_entries:
             self.show_message("No data available for report!")
             return
-            
+        
+        if report_type == 'custom':
+            title_suffix = f"{start_date:%Y-%m-%d} to {(end_date - timedelta(days=1)):%Y-%m-%d}"
+        else:
+            start_date, end_date, title_suffix = self.get_report_range(report_type)
+        
+        # Only load the entries in range, via the start-time index
+        entry_ids = self.entry_index.search(start_date=start_date, end_date=end_date)
+        df = pd.DataFrame(
+            [self.time_entries[i] for i in entry_ids],
+            columns=['project', 'category', 'start', 'end', 'duration', 'billable', 'rate']
+        )
         df['start'] = pd.to_datetime(df['start'])
+        df['category'] = df['category'].fillna('')
         df['duration'] = df['duration'] / 3600  # Convert to hours
         
         report_window = tk.Toplevel(self.root)
@@ -512,34 +908,28 @@ class TimeTrackerApp:
         summary_frame = ttk.Frame(notebook)
         notebook.add(summary_frame, text="Summary")
         
-        # Project distribution pie chart and daily hours bar chart
+        # Project distribution pie chart and bucketed hours bar chart
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-        
-        # Filter data based on report type
-        today = datetime.now()
-        if report_type == 'daily':
-            start_date = today.replace(hour=0, minute=0, second=0, microsecond=0)
-            df = df[df['start'] >= start_date]
-            title_suffix = "Today"
-        elif report_type == 'weekly':
-            start_date = today - timedelta(days=today.weekday())
-            df = df[df['start'] >= start_date]
-            title_suffix = "This Week"
-        else:  # monthly
-            start_date = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            df = df[df['start'] >= start_date]
-            title_suffix = "This Month"
 
         if not df.empty:
             # Project distribution pie chart
-            project_data = df.groupby('project')['duration'].sum()
+            project_data = df.groupby('project')['duration'].sum().sort_values(ascending=False)
+            if len(project_data) > self.MAX_PIE_WEDGES:
+                # Fold the smallest projects into one wedge to keep the chart readable
+                folded = project_data.iloc[self.MAX_PIE_WEDGES - 1:]
+                project_data = pd.concat([
+                    project_data.iloc[:self.MAX_PIE_WEDGES - 1],
+                    pd.Series({f"Other ({len(folded)} projects)": folded.sum()})
+                ])
             ax1.pie(project_data, labels=project_data.index, autopct='%1.1f%%')
             ax1.set_title(f'Time Distribution by Project - {title_suffix}')
             
-            # Daily hours bar chart
-            daily_data = df.groupby(df['start'].dt.date)['duration'].sum()
-            ax2.bar(daily_data.index, daily_data.values)
-            ax2.set_title(f'Daily Hours - {title_suffix}')
+            # Bucketed hours bar chart
+            bucket_data, bucket_name = self.bucket_durations(df, start_date, end_date)
+            ax2.bar(range(len(bucket_data)), bucket_data.values)
+            ax2.set_xticks(range(len(bucket_data)))
+            ax2.set_xticklabels(bucket_data.index)
+            ax2.set_title(f'{bucket_name} Hours - {title_suffix}')
             ax2.tick_params(axis='x', rotation=45)
         else:
             ax1.text(0.5, 0.5, 'No data for this period', ha='center')
@@ -577,8 +967,13 @@ class TimeTrackerApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         tree.configure(yscrollcommand=scrollbar.set)
         
-        # Populate treeview
-        for _, row in df.iterrows():
+        # Populate treeview with the most recent entries; exports still cover every entry in range
+        if len(df) > self.DISPLAY_ROW_LIMIT:
+            ttk.Label(
+                data_frame,
+                text=f"Showing most recent {self.DISPLAY_ROW_LIMIT} of {len(df)} entries"
+            ).pack(fill=tk.X, padx=5)
+        for _, row in df.tail(self.DISPLAY_ROW_LIMIT).iloc[::-1].iterrows():
             tree.insert("", "end", values=(
                 row['project'],
                 row.get('category', ''),